@@ -0,0 +1,62 @@
+"""Compare DB_MODE=sync against DB_MODE=async on the hot read endpoints.
+
+    DATABASE_URL=postgresql://localhost/backend_bench python benchmarks/bench_async.py
+
+For each mode a fresh uvicorn server is started and hit with 50, 200 and
+1000 concurrent clients; per-endpoint latency percentiles and throughput are
+printed and written to a JSON report.
+"""
+import argparse
+import asyncio
+
+from common import run_load, start_server, stop_server, write_report
+
+ENDPOINTS = [
+    ("donations", "GET", "/donations/", {}),
+    ("donors", "GET", "/donors/", {}),
+    ("activities", "GET", "/activities/", {}),
+    ("dashboard-summary", "GET", "/dashboard-summary/", {}),
+    ("fintrack-dashboard-summary", "GET", "/fintrack/dashboard-summary/", {"params": {"user_id": 1}}),
+]
+
+
+def pick_request(client_index, iteration):
+    return ENDPOINTS[(client_index + iteration) % len(ENDPOINTS)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modes", default="sync,async")
+    parser.add_argument("--concurrency", default="50,200,1000")
+    parser.add_argument("--requests-per-client", type=int, default=20)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--output", default="bench_async.json")
+    args = parser.parse_args()
+
+    report = {}
+    for mode in args.modes.split(","):
+        proc, base_url = start_server(args.port, env={"DB_MODE": mode})
+        try:
+            for concurrency in [int(c) for c in args.concurrency.split(",")]:
+                results, elapsed = asyncio.run(
+                    run_load(base_url, pick_request, concurrency,
+                             requests_per_client=args.requests_per_client)
+                )
+                report.setdefault(mode, {})[str(concurrency)] = {
+                    "elapsed_s": round(elapsed, 2),
+                    "endpoints": results
+                }
+                total = sum(r["requests"] for r in results.values())
+                print(f"{mode:>5} c={concurrency:<5} {total / elapsed:9.1f} req/s")
+                for name, summary in results.items():
+                    print(f"      {name:<28} p50={summary['p50_ms']}ms "
+                          f"p95={summary['p95_ms']}ms p99={summary['p99_ms']}ms "
+                          f"errors={summary['errors']}")
+        finally:
+            stop_server(proc)
+
+    write_report(args.output, report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Measure POST /donations/bulk throughput.
+
+    DATABASE_URL=postgresql://localhost/backend_bench python benchmarks/bench_bulk_import.py --rows 200000
+
+Builds a CSV and an NDJSON batch of --rows donations, posts each to a fresh
+server and reports rows/s as seen by the client and by the server (which
+excludes the upload itself).
+"""
+import argparse
+import json
+import time
+
+import httpx
+
+from common import start_server, stop_server, write_report
+
+
+def build_csv(rows, project):
+    lines = ["donor_name,amount,payment_method,date,project,notes"]
+    for i in range(rows):
+        lines.append(
+            f"Donor {i},{i % 1000 + 0.5},mobile_money,2024-01-{i % 28 + 1:02d},"
+            f"{project if i % 2 else ''},statement line {i}"
+        )
+    return "\n".join(lines).encode()
+
+
+def build_ndjson(rows, project):
+    return "\n".join(
+        json.dumps({
+            "donor_name": f"Donor {i}",
+            "amount": i % 1000 + 0.5,
+            "payment_method": "bank_transfer",
+            "date": f"2024-02-{i % 28 + 1:02d}",
+            "project": project if i % 2 else None,
+            "notes": f"statement line {i}"
+        })
+        for i in range(rows)
+    ).encode()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--project", default="Climate Change",
+                        help="an existing program area to credit")
+    parser.add_argument("--port", type=int, default=8768)
+    parser.add_argument("--output", default="bench_bulk_import.json")
+    args = parser.parse_args()
+
+    batches = [
+        ("csv", "text/csv", build_csv(args.rows, args.project)),
+        ("ndjson", "application/x-ndjson", build_ndjson(args.rows, args.project)),
+    ]
+
+    report = {}
+    proc, base_url = start_server(args.port)
+    try:
+        for name, content_type, body in batches:
+            started = time.perf_counter()
+            response = httpx.post(
+                f"{base_url}/donations/bulk",
+                content=body,
+                headers={"content-type": content_type},
+                timeout=None
+            )
+            elapsed = time.perf_counter() - started
+            response.raise_for_status()
+            result = response.json()
+            report[name] = {
+                "rows": args.rows,
+                "bytes": len(body),
+                "imported": result["imported"],
+                "failed": result["failed"],
+                "elapsed_s": round(elapsed, 2),
+                "client_rows_per_s": round(args.rows / elapsed),
+                "server_rows_per_s": result["rows_per_second"],
+            }
+            print(f"{name:>7}: {report[name]['client_rows_per_s']} rows/s end to end, "
+                  f"{result['rows_per_second']} rows/s in the server, "
+                  f"{result['failed']} failed")
+    finally:
+        stop_server(proc)
+
+    write_report(args.output, report)
+
+
+if __name__ == "__main__":
+    main()
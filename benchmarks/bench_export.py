@@ -0,0 +1,83 @@
+"""Check that CSV exports stream in constant memory.
+
+    DATABASE_URL=postgresql://localhost/backend_bench python benchmarks/bench_export.py --rows 1000000
+
+Tops the donations table up to --rows rows, starts a server, downloads
+/donations/export and samples the server's RSS while it streams. Peak RSS
+should stay close to the idle baseline whatever the row count.
+"""
+import argparse
+import os
+import time
+
+import httpx
+import psycopg2
+
+from common import RssSampler, rss_kb, start_server, stop_server, write_report
+
+
+def seed_donations(rows):
+    conn = psycopg2.connect(os.environ["DATABASE_URL"])
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM donations")
+        existing = cursor.fetchone()[0]
+        if existing < rows:
+            cursor.execute("""
+                INSERT INTO donations (donor_name, amount, payment_method, date, notes, status)
+                SELECT 'Donor ' || g, (g % 1000) + 0.5, 'mobile_money',
+                       DATE '2020-01-01' + (g % 1500), 'synthetic', 'completed'
+                FROM generate_series(1, %s) g
+            """, (rows - existing,))
+            conn.commit()
+        return max(existing, rows)
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--output", default="bench_export.json")
+    args = parser.parse_args()
+
+    proc, base_url = start_server(args.port)
+    try:
+        total_rows = seed_donations(args.rows)
+        baseline = rss_kb(proc.pid)
+
+        started = time.perf_counter()
+        first_byte = None
+        size = 0
+        lines = 0
+        with RssSampler(proc.pid) as sampler:
+            with httpx.stream("GET", f"{base_url}/donations/export", timeout=None) as response:
+                response.raise_for_status()
+                for chunk in response.iter_bytes():
+                    if first_byte is None:
+                        first_byte = time.perf_counter() - started
+                    size += len(chunk)
+                    lines += chunk.count(b"\n")
+        elapsed = time.perf_counter() - started
+
+        report = {
+            "table_rows": total_rows,
+            "csv_lines": lines,
+            "bytes": size,
+            "elapsed_s": round(elapsed, 2),
+            "time_to_first_byte_ms": round(first_byte * 1000, 2) if first_byte else None,
+            "rows_per_s": round((lines - 1) / elapsed) if elapsed else None,
+            "rss_baseline_kb": baseline,
+            "rss_peak_kb": sampler.peak,
+        }
+        report["rss_growth_kb"] = report["rss_peak_kb"] - baseline
+        for key, value in report.items():
+            print(f"{key:>24}: {value}")
+        write_report(args.output, report)
+    finally:
+        stop_server(proc)
+
+
+if __name__ == "__main__":
+    main()
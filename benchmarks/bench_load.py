@@ -0,0 +1,193 @@
+"""Replay a realistic mix of API calls and record latency per endpoint.
+
+    DATABASE_URL=postgresql://localhost/backend_bench python benchmarks/synthetic_data.py --reset
+    DATABASE_URL=postgresql://localhost/backend_bench python benchmarks/bench_load.py --compare baseline.json
+
+Starts a server and drives it with --concurrency clients for --duration
+seconds each, choosing calls from MIX by weight: dashboards, donor search
+and typeahead, donation creation and listing, report listing and search,
+and small file uploads. The choice sequence depends only on --seed, so two
+runs against the same synthetic dataset replay the same traffic. The JSON
+report holds p50/p95/p99 latency and throughput per endpoint, along with
+the configuration, commit and table sizes needed to compare reports;
+--compare prints the change against an earlier one.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+from datetime import date, timedelta
+
+import psycopg2
+
+from common import ROOT, run_load, start_server, stop_server, write_report
+
+# (name, weight); see build_request for what each one sends
+MIX = [
+    ("dashboard-summary", 15),
+    ("fintrack-dashboard-summary", 5),
+    ("donor-search", 15),
+    ("donor-typeahead", 15),
+    ("donation-create", 10),
+    ("donation-list", 10),
+    ("director-reports", 10),
+    ("report-search", 10),
+    ("file-upload", 5),
+]
+
+# Drawn from the synthetic_data.py vocabularies so searches find rows
+NAME_FRAGMENTS = ["Amina", "Okello", "Grace N", "Mukasa", "David", "Nakato", "Joseph K", "Auma"]
+TYPEAHEAD_PREFIXES = ["a", "am", "br", "gra", "jos", "mo", "nao", "sam", "wi", "zai"]
+REPORT_TERMS = ["borehole", "water training", "climate -tree", "\"savings group\"", "latrine OR sanitation"]
+PROGRAM_AREAS = ["Women Empowerment", "Vocational Education", "Climate Change", "Reproductive Health"]
+PAYMENT_METHODS = ["mobile_money", "bank_transfer", "cash", "cheque"]
+UPLOAD_SIZE = 64 * 1024
+
+DATASET_TABLES = ["donors", "donations", "expenses", "reports", "files", "payments"]
+
+
+def build_request(name, rng, tag, upload_block):
+    """(method, path, httpx kwargs) for one call of `name`"""
+    if name == "dashboard-summary":
+        return "GET", "/dashboard-summary/", {}
+    if name == "fintrack-dashboard-summary":
+        return "GET", "/fintrack/dashboard-summary/", {"params": {"user_id": rng.randint(1, 5000)}}
+    if name == "donor-search":
+        return "GET", "/donors/", {"params": {"search": rng.choice(NAME_FRAGMENTS), "limit": 20}}
+    if name == "donor-typeahead":
+        return "GET", "/donors/typeahead/", {"params": {"q": rng.choice(TYPEAHEAD_PREFIXES)}}
+    if name == "donation-create":
+        return "POST", "/donations/", {"json": {
+            "donor_name": f"Load test donor {rng.randint(1, 10_000)}",
+            "amount": round(rng.uniform(5, 5000), 2),
+            "payment_method": rng.choice(PAYMENT_METHODS),
+            "date": (date(2024, 1, 1) + timedelta(days=rng.randint(0, 365))).isoformat(),
+            "project": rng.choice(PROGRAM_AREAS),
+            "notes": "bench_load"
+        }}
+    if name == "donation-list":
+        return "GET", "/donations/", {"params": {"limit": 50}}
+    if name == "director-reports":
+        return "GET", "/director/reports/", {"params": {
+            "status": rng.choice(["submitted", "approved", "all"]),
+            "per_page": 20,
+            "count": "estimated"
+        }}
+    if name == "report-search":
+        return "GET", "/reports/search", {"params": {"q": rng.choice(REPORT_TERMS), "limit": 20}}
+    if name == "file-upload":
+        # A unique prefix keeps uploads from deduplicating into one blob
+        payload = tag.encode().ljust(64) + upload_block
+        return "POST", "/upload/", {"files": {"files": (f"{tag}.bin", payload, "application/octet-stream")}}
+    raise ValueError(name)
+
+
+def request_picker(seed):
+    names = [name for name, _ in MIX]
+    weights = [weight for _, weight in MIX]
+    upload_block = random.Random(seed).randbytes(UPLOAD_SIZE)
+
+    def pick_request(client_index, iteration):
+        rng = random.Random(f"{seed}:{client_index}:{iteration}")
+        name = rng.choices(names, weights)[0]
+        tag = f"bench-{seed}-{client_index}-{iteration}"
+        return (name,) + build_request(name, rng, tag, upload_block)
+
+    return pick_request
+
+
+def dataset_sizes():
+    """Planner row estimates for the big tables (exact once ANALYZEd)"""
+    conn = psycopg2.connect(os.environ["DATABASE_URL"])
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT relname, reltuples::bigint FROM pg_class WHERE relname = ANY(%s) AND relkind = 'r'",
+            (DATASET_TABLES,)
+        )
+        return dict(cursor.fetchall())
+    finally:
+        conn.close()
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(previous, report):
+    """Print p95 and throughput changes against an earlier report"""
+    for concurrency, run in report["runs"].items():
+        before = previous.get("runs", {}).get(concurrency)
+        if not before:
+            continue
+        print(f"c={concurrency} vs {previous.get('commit')}: "
+              f"{before['throughput_rps']} -> {run['throughput_rps']} req/s")
+        for name, summary in run["endpoints"].items():
+            old = before["endpoints"].get(name)
+            if not old or not old["p95_ms"] or not summary["p95_ms"]:
+                continue
+            change = (summary["p95_ms"] - old["p95_ms"]) / old["p95_ms"] * 100
+            print(f"      {name:<28} p95 {old['p95_ms']:>9}ms -> {summary['p95_ms']:>9}ms ({change:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", default="10,50,200")
+    parser.add_argument("--duration", type=float, default=30,
+                        help="seconds of load per concurrency level")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--mode", default="sync", choices=["sync", "async"],
+                        help="DB_MODE for the server")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--port", type=int, default=8769)
+    parser.add_argument("--output", default="bench_load.json")
+    parser.add_argument("--compare", help="earlier report to compare against")
+    args = parser.parse_args()
+
+    report = {
+        "commit": git_commit(),
+        "config": {
+            "mode": args.mode,
+            "workers": args.workers,
+            "duration_s": args.duration,
+            "seed": args.seed,
+            "mix": dict(MIX),
+        },
+        "dataset": dataset_sizes(),
+        "runs": {}
+    }
+    pick_request = request_picker(args.seed)
+    proc, base_url = start_server(args.port, env={"DB_MODE": args.mode}, workers=args.workers)
+    try:
+        for concurrency in [int(c) for c in args.concurrency.split(",")]:
+            results, elapsed = asyncio.run(
+                run_load(base_url, pick_request, concurrency, duration=args.duration)
+            )
+            total = sum(r["requests"] for r in results.values())
+            report["runs"][str(concurrency)] = {
+                "elapsed_s": round(elapsed, 2),
+                "throughput_rps": round(total / elapsed, 2),
+                "endpoints": results
+            }
+            print(f"c={concurrency:<5} {total / elapsed:9.1f} req/s")
+            for name, summary in results.items():
+                print(f"      {name:<28} {summary['throughput_rps']:>8} req/s "
+                      f"p50={summary['p50_ms']}ms p95={summary['p95_ms']}ms "
+                      f"p99={summary['p99_ms']}ms errors={summary['errors']}")
+    finally:
+        stop_server(proc)
+
+    write_report(args.output, report)
+    if args.compare:
+        with open(args.compare) as previous:
+            compare(json.load(previous), report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Measure concurrent large uploads to POST /upload/.
+
+    DATABASE_URL=postgresql://localhost/backend_bench python benchmarks/bench_upload.py
+
+Starts a server and sends --clients concurrent uploads of --size-mb MB each
+(100 x 50 MB by default), reporting upload latency percentiles, aggregate
+throughput and the server's peak RSS. The server needs UPLOAD_MAX_FILE_SIZE
+at least as large as the payload; it is raised automatically here.
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+import httpx
+
+from common import RssSampler, rss_kb, start_server, stop_server, summarize, write_report
+
+
+def make_payload(size_mb):
+    """Write a size_mb MB file once; every client streams it from disk"""
+    handle, path = tempfile.mkstemp(suffix=".bin")
+    block = os.urandom(1024 * 1024)
+    with os.fdopen(handle, "wb") as out:
+        for _ in range(size_mb):
+            out.write(block)
+    return path
+
+
+async def upload_all(base_url, payload_path, clients):
+    latencies = []
+    errors = 0
+    limits = httpx.Limits(max_connections=clients)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=None) as client:
+
+        async def upload(index):
+            nonlocal errors
+            with open(payload_path, "rb") as payload:
+                files = {"files": (f"bench-{index}.bin", payload, "application/octet-stream")}
+                t0 = time.perf_counter()
+                try:
+                    response = await client.post("/upload/", files=files)
+                    ok = response.status_code < 400
+                except httpx.HTTPError:
+                    ok = False
+                if ok:
+                    latencies.append(time.perf_counter() - t0)
+                else:
+                    errors += 1
+
+        started = time.monotonic()
+        await asyncio.gather(*(upload(i) for i in range(clients)))
+        elapsed = time.monotonic() - started
+    return latencies, errors, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--size-mb", type=int, default=50)
+    parser.add_argument("--port", type=int, default=8767)
+    parser.add_argument("--output", default="bench_upload.json")
+    args = parser.parse_args()
+
+    payload_path = make_payload(args.size_mb)
+    env = {"UPLOAD_MAX_FILE_SIZE": str((args.size_mb + 1) * 1024 * 1024)}
+    proc, base_url = start_server(args.port, env=env)
+    try:
+        baseline = rss_kb(proc.pid)
+        with RssSampler(proc.pid) as sampler:
+            latencies, errors, elapsed = asyncio.run(
+                upload_all(base_url, payload_path, args.clients)
+            )
+
+        report = summarize(latencies, errors, elapsed)
+        report.update({
+            "clients": args.clients,
+            "size_mb": args.size_mb,
+            "elapsed_s": round(elapsed, 2),
+            "mb_per_s": round(len(latencies) * args.size_mb / elapsed, 2) if elapsed else None,
+            "rss_baseline_kb": baseline,
+            "rss_peak_kb": sampler.peak,
+        })
+        report["rss_growth_kb"] = report["rss_peak_kb"] - baseline
+        for key, value in report.items():
+            print(f"{key:>16}: {value}")
+        write_report(args.output, report)
+    finally:
+        stop_server(proc)
+        os.unlink(payload_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""Shared helpers for the load benchmarks in this directory.
+
+The benchmarks start their own uvicorn process against DATABASE_URL (point it
+at a local, disposable Postgres) and drive it with httpx.
+"""
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def start_server(port, env=None, workers=1):
+    """Run main:app under uvicorn and wait until it answers requests"""
+    server_env = dict(os.environ)
+    server_env.update(env or {})
+    proc = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "main:app",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(workers), "--log-level", "warning"
+        ],
+        cwd=ROOT,
+        env=server_env
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"server exited with code {proc.returncode}")
+        try:
+            httpx.get(f"{base_url}/admin/db-pool", timeout=1)
+            return proc, base_url
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    proc.terminate()
+    raise RuntimeError("server did not start within 60s")
+
+
+def stop_server(proc):
+    proc.terminate()
+    try:
+        proc.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+
+def rss_kb(pid, field="VmRSS"):
+    """Resident memory of a process in kB, read from /proc"""
+    with open(f"/proc/{pid}/status") as status:
+        for line in status:
+            if line.startswith(field + ":"):
+                return int(line.split()[1])
+    return None
+
+
+class RssSampler:
+    """Sample a process's RSS in a background thread until stopped"""
+
+    def __init__(self, pid, interval=0.05):
+        self.pid = pid
+        self.interval = interval
+        self.samples = []
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._done.is_set():
+            self.samples.append(rss_kb(self.pid))
+            time.sleep(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._done.set()
+        self._thread.join()
+
+    @property
+    def peak(self):
+        values = [s for s in self.samples if s is not None]
+        return max(values) if values else None
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies, errors, elapsed):
+    """Latency percentiles (ms) and throughput for one endpoint"""
+    ordered = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else None,
+        "p50_ms": _ms(percentile(ordered, 50)),
+        "p95_ms": _ms(percentile(ordered, 95)),
+        "p99_ms": _ms(percentile(ordered, 99)),
+        "max_ms": _ms(ordered[-1] if ordered else None)
+    }
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 2) if seconds is not None else None
+
+
+async def run_load(base_url, pick_request, concurrency, requests_per_client=None, duration=None):
+    """Drive the server with `concurrency` clients.
+
+    pick_request(client_index, iteration) returns (name, method, path, kwargs);
+    each client stops after requests_per_client requests or once duration
+    seconds have passed. Returns ({name: summary}, elapsed_seconds).
+    """
+    latencies = {}
+    errors = {}
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=120) as client:
+        started = time.monotonic()
+        stop_at = started + duration if duration else None
+
+        async def worker(index):
+            iteration = 0
+            while True:
+                if requests_per_client is not None and iteration >= requests_per_client:
+                    return
+                if stop_at is not None and time.monotonic() >= stop_at:
+                    return
+                name, method, path, kwargs = pick_request(index, iteration)
+                iteration += 1
+                t0 = time.perf_counter()
+                try:
+                    response = await client.request(method, path, **kwargs)
+                    ok = response.status_code < 400
+                except httpx.HTTPError:
+                    ok = False
+                elapsed = time.perf_counter() - t0
+                if ok:
+                    latencies.setdefault(name, []).append(elapsed)
+                else:
+                    errors[name] = errors.get(name, 0) + 1
+
+        await asyncio.gather(*(worker(i) for i in range(concurrency)))
+        elapsed = time.monotonic() - started
+
+    names = set(latencies) | set(errors)
+    return {
+        name: summarize(latencies.get(name, []), errors.get(name, 0), elapsed)
+        for name in sorted(names)
+    }, elapsed
+
+
+def write_report(path, report):
+    Path(path).write_text(json.dumps(report, indent=2, default=str))
+    print(f"Report written to {path}")
@@ -0,0 +1,481 @@
+"""Fill a disposable database with deterministic synthetic data.
+
+    DATABASE_URL=postgresql://localhost/backend_bench python benchmarks/synthetic_data.py --scale 1 --reset
+
+Applies pending migrations, then replaces the contents of every table the
+application creates with generated rows. At --scale 1 that is 1M donations
+from 100k donors, 500k expenses and proportionate volumes elsewhere;
+--rows table=N overrides a single table. The same --seed and row counts
+always produce the same data, so benchmark runs against it are comparable.
+
+Rows are generated inside Postgres (INSERT ... SELECT over generate_series,
+with setseed() per table) rather than sent from Python. Every file and
+attachment row points at one small placeholder blob written under BLOB_DIR.
+"""
+import argparse
+import hashlib
+import os
+import random
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import psycopg2
+
+from common import ROOT
+
+# Row counts at --scale 1
+BASE_ROWS = {
+    "donors": 100_000,
+    "donations": 1_000_000,
+    "projects": 200,
+    "activities": 2_000,
+    "budget_items": 20_000,
+    "employees": 5_000,
+    "deployments": 20_000,
+    "work_opportunities": 1_000,
+    "opportunity_assignments": 5_000,
+    "payments": 100_000,
+    "reports": 50_000,
+    "report_attachments": 50_000,
+    "activity_approvals": 10_000,
+    "folders": 2_000,
+    "files": 100_000,
+    "savings_accounts": 50,
+    "savings_transactions": 200_000,
+    "expenses": 500_000,
+    "user_settings": 5_000,
+    "cold_turkey_challenges": 5_000,
+    "cold_turkey_milestones": 20_000,
+}
+
+# Replaced wholesale on every run. program_areas, bank_accounts and
+# expense_categories keep their seeded rows, which donations and expenses
+# refer to by name or id.
+GENERATED_TABLES = [
+    "donation_totals", "donations", "donors", "budget_items", "deployments",
+    "opportunity_assignments", "work_opportunities", "payments",
+    "report_attachments", "reports", "activity_approvals", "activities",
+    "projects", "employees", "files", "folders", "blobs",
+    "savings_transactions", "savings_accounts", "expenses",
+    "cold_turkey_milestones", "cold_turkey_challenges", "user_settings",
+]
+
+FIRST_NAMES = [
+    "Amina", "Brian", "Catherine", "David", "Esther", "Francis", "Grace",
+    "Henry", "Irene", "Joseph", "Kevin", "Lydia", "Moses", "Naomi", "Oscar",
+    "Patience", "Quincy", "Rebecca", "Samuel", "Teddy", "Umar", "Violet",
+    "Winnie", "Xavier", "Yusuf", "Zainab",
+]
+LAST_NAMES = [
+    "Okello", "Namutebi", "Mugisha", "Atuhaire", "Ssemakula", "Nakato",
+    "Kato", "Achieng", "Owor", "Byaruhanga", "Tumusiime", "Nalwoga",
+    "Mukasa", "Akello", "Kiggundu", "Nabirye", "Opio", "Babirye", "Lubega",
+    "Auma",
+]
+WORDS = [
+    "water", "borehole", "training", "clinic", "school", "farmers", "seedlings",
+    "sanitation", "hygiene", "women", "youth", "savings", "group", "district",
+    "village", "community", "health", "maternal", "vocational", "tailoring",
+    "carpentry", "climate", "tree", "planting", "irrigation", "harvest",
+    "market", "loan", "literacy", "workshop", "supplies", "transport",
+    "meeting", "survey", "monitoring", "evaluation", "volunteers", "outreach",
+    "budget", "report", "quarter", "progress", "delayed", "completed",
+    "materials", "construction", "latrine", "nutrition", "immunisation",
+    "mentorship",
+]
+PAYMENT_METHODS = ["mobile_money", "bank_transfer", "cash", "cheque"]
+
+PLACEHOLDER_BLOB = b"synthetic attachment\n" * 512
+BLOB_DIR = Path(os.getenv("BLOB_DIR", "uploads/blobs"))
+
+EPOCH = "TIMESTAMP '2019-01-01'"
+SPAN_DAYS = 6 * 365
+
+
+def pick(array):
+    """SQL expression choosing a random element of the %(array)s parameter"""
+    return f"(%({array})s::text[])[1 + floor(random() * cardinality(%({array})s::text[]))::int]"
+
+
+def pick_id(array):
+    """SQL expression choosing a random element of an id array column"""
+    return f"{array}[1 + floor(random() * cardinality({array}))::int]"
+
+
+def words(count):
+    """Roughly `count` random words; referencing g makes the subquery run per row"""
+    return (f"(SELECT string_agg({pick('words')}, ' ') "
+            f"FROM generate_series(1, {count} + mod(g, 5)))")
+
+
+RANDOM_DATE = f"(DATE '2019-01-01' + floor(random() * {SPAN_DAYS})::int)"
+RANDOM_TIME = f"({EPOCH} + random() * INTERVAL '{SPAN_DAYS} days')"
+
+GENERATORS = [
+    ("donors", f"""
+        INSERT INTO donors (name, email, phone, address, donor_type, notes, category, created_at)
+        SELECT name, lower(replace(name, ' ', '.')) || g || '@example.org',
+               '+2567' || lpad(mod(g::bigint * 7919, 100000000)::text, 8, '0'),
+               'Plot ' || mod(g, 500) || ', ' || {pick('last')} || ' Road',
+               (ARRAY['individual', 'organization', 'foundation'])[1 + floor(random() * 3)::int],
+               CASE WHEN random() < 0.2 THEN {words(6)} END,
+               (ARRAY['one-time', 'recurring', 'major'])[1 + floor(random() * 3)::int],
+               {RANDOM_TIME}
+        FROM (SELECT g, {pick('first')} || ' ' || {pick('last')} AS name
+              FROM generate_series(1, %(n)s) g) s
+    """),
+    ("donations", f"""
+        WITH d AS (SELECT array_agg(id ORDER BY id) AS ids FROM donors),
+             p AS (SELECT array_agg(name ORDER BY id) AS names FROM program_areas)
+        INSERT INTO donations (donor_id, donor_name, amount, payment_method, date,
+                               project, notes, status, created_at)
+        SELECT s.donor_id, COALESCE(dn.name, 'Anonymous'), s.amount, s.method, s.date,
+               s.project, s.notes, s.status, s.date + random() * INTERVAL '1 day'
+        FROM (
+            -- A few donors give most of the donations
+            SELECT CASE WHEN random() < 0.1 THEN NULL
+                        ELSE d.ids[1 + floor(power(random(), 3) * cardinality(d.ids))::int] END AS donor_id,
+                   round(exp(random() * 9)::numeric, 2) AS amount,
+                   {pick('methods')} AS method,
+                   {RANDOM_DATE} AS date,
+                   CASE WHEN random() < 0.8 THEN p.names[1 + floor(random() * cardinality(p.names))::int] END AS project,
+                   CASE WHEN random() < 0.3 THEN 'Synthetic donation ' || g END AS notes,
+                   CASE WHEN random() < 0.95 THEN 'completed' ELSE 'pending' END AS status
+            FROM generate_series(1, %(n)s) g, d, p
+        ) s
+        LEFT JOIN donors dn ON dn.id = s.donor_id
+    """),
+    ("projects", f"""
+        INSERT INTO projects (name, description, start_date, end_date, budget,
+                              funding_source, status, created_at)
+        SELECT 'Project ' || g || ': ' || {words(3)}, {words(20)},
+               start_date, start_date + 90 + floor(random() * 630)::int,
+               round((random() * 500000)::numeric, 2),
+               (ARRAY['USAID', 'EU', 'Private donors', 'UNICEF', 'Internal'])[1 + floor(random() * 5)::int],
+               (ARRAY['planning', 'active', 'completed'])[1 + floor(random() * 3)::int],
+               start_date - 30
+        FROM (SELECT g, {RANDOM_DATE} AS start_date FROM generate_series(1, %(n)s) g) s
+    """),
+    ("activities", f"""
+        WITH p AS (SELECT array_agg(id ORDER BY id) AS ids FROM projects)
+        INSERT INTO activities (name, project_id, description, start_date, end_date,
+                                budget, status, created_at)
+        SELECT 'Activity ' || g || ': ' || {words(3)}, {pick_id('p.ids')}, {words(15)},
+               start_date, start_date + 7 + floor(random() * 180)::int,
+               round((random() * 50000)::numeric, 2),
+               (ARRAY['planned', 'in_progress', 'completed'])[1 + floor(random() * 3)::int],
+               start_date - 14
+        FROM (SELECT g, {RANDOM_DATE} AS start_date FROM generate_series(1, %(n)s) g) s, p
+    """),
+    ("budget_items", f"""
+        WITH a AS (SELECT array_agg(id ORDER BY id) AS ids FROM activities)
+        INSERT INTO budget_items (project_id, activity_id, item_name, description,
+                                  quantity, unit_price, category, created_at)
+        SELECT act.project_id, act.id, s.item, s.description, s.quantity, s.unit_price,
+               s.category, act.created_at + INTERVAL '1 day'
+        FROM (
+            SELECT {pick_id('a.ids')} AS activity_id, {words(2)} AS item, {words(8)} AS description,
+                   1 + floor(random() * 50) AS quantity, round((random() * 500)::numeric, 2) AS unit_price,
+                   (ARRAY['materials', 'transport', 'personnel', 'equipment'])[1 + floor(random() * 4)::int] AS category
+            FROM generate_series(1, %(n)s) g, a
+        ) s
+        JOIN activities act ON act.id = s.activity_id
+    """),
+    ("employees", f"""
+        INSERT INTO employees (name, nin, dob, qualification, email, phone, address, status, created_at)
+        SELECT name, 'CM' || lpad(g::text, 12, '0'),
+               DATE '1965-01-01' + floor(random() * 13000)::int,
+               (ARRAY['Certificate', 'Diploma', 'Degree', 'Masters'])[1 + floor(random() * 4)::int],
+               lower(replace(name, ' ', '.')) || g || '@staff.example.org',
+               '+2567' || lpad(mod(g::bigint * 104729, 100000000)::text, 8, '0'),
+               {pick('last')} || ' Village',
+               CASE WHEN random() < 0.95 THEN 'active' ELSE 'inactive' END,
+               {RANDOM_TIME}
+        FROM (SELECT g, {pick('first')} || ' ' || {pick('last')} AS name
+              FROM generate_series(1, %(n)s) g) s
+    """),
+    ("deployments", f"""
+        WITH e AS (SELECT array_agg(id ORDER BY id) AS ids FROM employees),
+             a AS (SELECT array_agg(id ORDER BY id) AS ids FROM activities)
+        INSERT INTO deployments (employee_id, activity_id, role, created_at)
+        SELECT {pick_id('e.ids')}, {pick_id('a.ids')},
+               (ARRAY['Facilitator', 'Coordinator', 'Driver', 'Field officer'])[1 + floor(random() * 4)::int],
+               {RANDOM_TIME}
+        FROM generate_series(1, %(n)s) g, e, a
+    """),
+    ("work_opportunities", f"""
+        INSERT INTO work_opportunities (title, description, status, created_at)
+        SELECT 'Opportunity ' || g || ': ' || {words(3)}, {words(25)},
+               CASE WHEN random() < 0.3 THEN 'open' ELSE 'closed' END, {RANDOM_TIME}
+        FROM generate_series(1, %(n)s) g
+    """),
+    ("opportunity_assignments", f"""
+        WITH w AS (SELECT array_agg(id ORDER BY id) AS ids FROM work_opportunities),
+             e AS (SELECT array_agg(id ORDER BY id) AS ids FROM employees)
+        INSERT INTO opportunity_assignments (opportunity_id, employee_id, created_at)
+        SELECT {pick_id('w.ids')}, {pick_id('e.ids')}, {RANDOM_TIME}
+        FROM generate_series(1, %(n)s) g, w, e
+    """),
+    ("payments", f"""
+        WITH e AS (SELECT array_agg(id ORDER BY id) AS ids FROM employees)
+        INSERT INTO payments (employee_id, amount, payment_period, description,
+                              payment_method, status, remarks, created_at, approved_at)
+        SELECT employee_id, amount, to_char(created_at, 'YYYY-MM'), 'Monthly allowance',
+               method, status, NULL, created_at,
+               CASE WHEN status <> 'pending' THEN created_at + INTERVAL '2 days' END
+        FROM (
+            SELECT {pick_id('e.ids')} AS employee_id, round((50000 + random() * 950000)::numeric, 2) AS amount,
+                   {pick('methods')} AS method, {RANDOM_TIME} AS created_at,
+                   (ARRAY['pending', 'approved', 'approved', 'approved', 'rejected'])[1 + floor(random() * 5)::int] AS status
+            FROM generate_series(1, %(n)s) g, e
+        ) s
+    """),
+    ("reports", f"""
+        WITH e AS (SELECT array_agg(id ORDER BY id) AS ids FROM employees),
+             a AS (SELECT array_agg(id ORDER BY id) AS ids FROM activities)
+        INSERT INTO reports (employee_id, activity_id, title, content, status, submitted_by, created_at)
+        SELECT employee_id, activity_id, title, content, status, employee_id, created_at
+        FROM (
+            SELECT {pick_id('e.ids')} AS employee_id, {pick_id('a.ids')} AS activity_id,
+                   initcap({words(4)}) AS title, {words(80)} AS content,
+                   (ARRAY['submitted', 'approved', 'rejected'])[1 + floor(random() * 3)::int] AS status,
+                   {RANDOM_TIME} AS created_at
+            FROM generate_series(1, %(n)s) g, e, a
+        ) s
+    """),
+    ("report_attachments", f"""
+        WITH r AS (SELECT array_agg(id ORDER BY id) AS ids FROM reports)
+        INSERT INTO report_attachments (report_id, original_filename, stored_filename,
+                                        file_type, blob_hash, created_at)
+        SELECT {pick_id('r.ids')}, 'attachment-' || g || '.txt', %(blob_path)s,
+               'text/plain', %(blob_hash)s, {RANDOM_TIME}
+        FROM generate_series(1, %(n)s) g, r
+    """),
+    ("activity_approvals", f"""
+        WITH a AS (SELECT array_agg(id ORDER BY id) AS ids FROM activities)
+        INSERT INTO activity_approvals (activity_id, activity_name, requested_by, requested_amount,
+                                        comments, status, created_at)
+        SELECT act.id, act.name, s.requested_by, s.amount, s.comments, s.status, s.created_at
+        FROM (
+            SELECT {pick_id('a.ids')} AS activity_id, {pick('first')} || ' ' || {pick('last')} AS requested_by,
+                   round((random() * 20000)::numeric, 2) AS amount, {words(10)} AS comments,
+                   (ARRAY['pending', 'approved', 'rejected'])[1 + floor(random() * 3)::int] AS status,
+                   {RANDOM_TIME} AS created_at
+            FROM generate_series(1, %(n)s) g, a
+        ) s
+        JOIN activities act ON act.id = s.activity_id
+    """),
+    ("folders", f"""
+        INSERT INTO folders (id, name, parent_id)
+        SELECT md5(%(seed)s || ':folder:' || g)::uuid::text, initcap({words(2)}),
+               CASE WHEN g <= 20 THEN 'root'
+                    ELSE md5(%(seed)s || ':folder:' || (1 + floor(random() * (g - 1)))::int)::uuid::text END
+        FROM generate_series(1, %(n)s) g
+    """),
+    ("files", f"""
+        WITH f AS (SELECT array_agg(id ORDER BY id) AS ids FROM folders)
+        INSERT INTO files (id, name, type, size, folder_id, path, blob_hash)
+        SELECT md5(%(seed)s || ':file:' || g)::uuid::text, 'document-' || g || '.txt',
+               'text/plain', %(blob_size)s, {pick_id('f.ids')}, %(blob_path)s, %(blob_hash)s
+        FROM generate_series(1, %(n)s) g, f
+    """),
+    ("savings_accounts", f"""
+        INSERT INTO savings_accounts (name, balance, target, description, created_at)
+        SELECT CASE g WHEN 1 THEN 'Main Account' WHEN 2 THEN 'Emergency Fund'
+                      ELSE 'Savings ' || g || ': ' || {words(2)} END,
+               0, CASE WHEN random() < 0.5 THEN round((random() * 10000)::numeric, 2) END,
+               {words(6)}, {RANDOM_TIME}
+        FROM generate_series(1, %(n)s) g
+    """),
+    ("savings_transactions", f"""
+        WITH a AS (SELECT array_agg(id ORDER BY id) AS ids FROM savings_accounts)
+        INSERT INTO savings_transactions (account_id, amount, date, description, transaction_type, created_at)
+        SELECT account_id, amount, date, description, transaction_type, date + random() * INTERVAL '1 day'
+        FROM (
+            SELECT {pick_id('a.ids')} AS account_id, {RANDOM_DATE} AS date, {words(4)} AS description,
+                   CASE WHEN random() < 0.7 THEN 'deposit' ELSE 'withdrawal' END AS transaction_type,
+                   round((1 + random() * 500)::numeric, 2) AS amount
+            FROM generate_series(1, %(n)s) g, a
+        ) s
+    """),
+    ("expenses", f"""
+        WITH c AS (SELECT array_agg(id ORDER BY id) AS ids FROM expense_categories)
+        INSERT INTO expenses (category_id, amount, date, description, payment_method, created_at)
+        SELECT category_id, amount, date, description, method, date + random() * INTERVAL '1 day'
+        FROM (
+            SELECT {pick_id('c.ids')} AS category_id, round(exp(random() * 6)::numeric, 2) AS amount,
+                   {RANDOM_DATE} AS date, {words(5)} AS description, {pick('methods')} AS method
+            FROM generate_series(1, %(n)s) g, c
+        ) s
+    """),
+    ("user_settings", """
+        INSERT INTO user_settings (user_id, currency, savings_goals_notifications,
+                                   expense_alerts, dark_mode)
+        SELECT g, (ARRAY['USD', 'UGX', 'KES', 'EUR'])[1 + floor(random() * 4)::int],
+               random() < 0.8, random() < 0.6, random() < 0.3
+        FROM generate_series(1, %(n)s) g
+    """),
+    ("cold_turkey_challenges", f"""
+        WITH u AS (SELECT array_agg(user_id ORDER BY user_id) AS ids FROM user_settings),
+             c AS (SELECT array_agg(name ORDER BY id) AS names FROM expense_categories)
+        INSERT INTO cold_turkey_challenges (user_id, target_category, target_days, start_date,
+                                            end_date, status, money_saved, created_at)
+        SELECT user_id, category, days, start_date, start_date + days, status,
+               round((random() * 300)::numeric, 2), start_date
+        FROM (
+            SELECT {pick_id('u.ids')} AS user_id,
+                   c.names[1 + floor(random() * cardinality(c.names))::int] AS category,
+                   (ARRAY[7, 14, 30, 60, 90])[1 + floor(random() * 5)::int] AS days,
+                   {RANDOM_DATE} AS start_date,
+                   (ARRAY['active', 'completed', 'completed', 'failed'])[1 + floor(random() * 4)::int] AS status
+            FROM generate_series(1, %(n)s) g, u, c
+        ) s
+    """),
+    ("cold_turkey_milestones", f"""
+        WITH c AS (SELECT array_agg(id ORDER BY id) AS ids FROM cold_turkey_challenges)
+        INSERT INTO cold_turkey_milestones (challenge_id, days, achieved, achieved_date, created_at)
+        SELECT challenge_id, days, achieved, CASE WHEN achieved THEN {RANDOM_DATE} END, {RANDOM_TIME}
+        FROM (
+            SELECT {pick_id('c.ids')} AS challenge_id,
+                   (ARRAY[1, 3, 7, 14, 30])[1 + floor(random() * 5)::int] AS days,
+                   random() < 0.6 AS achieved
+            FROM generate_series(1, %(n)s) g, c
+        ) s
+    """),
+]
+
+# Per-row count triggers; every generated file row would update the one
+# placeholder blob, so they are off while generating and the counts are
+# rebuilt in FINALIZE instead
+COUNT_TRIGGERS = [
+    ("files", "files_blob_ref_count"),
+    ("report_attachments", "report_attachments_blob_ref_count"),
+    ("report_attachments", "report_attachments_count"),
+]
+
+# Derived state the API keeps in step on every write
+FINALIZE = [
+    """
+        UPDATE blobs b
+        SET ref_count = (SELECT COUNT(*) FROM files WHERE blob_hash = b.hash)
+                      + (SELECT COUNT(*) FROM report_attachments WHERE blob_hash = b.hash)
+    """,
+    """
+        UPDATE reports r
+        SET attachments_count = ra.count
+        FROM (SELECT report_id, COUNT(*) AS count FROM report_attachments GROUP BY report_id) ra
+        WHERE ra.report_id = r.id
+    """,
+    """
+        INSERT INTO donation_totals (status, total, donation_count)
+        SELECT status, SUM(amount), COUNT(*) FROM donations GROUP BY status
+    """,
+    """
+        UPDATE program_areas pa
+        SET balance = COALESCE((SELECT SUM(amount) FROM donations d
+                                WHERE d.project = pa.name AND d.status = 'completed'), 0)
+    """,
+    """
+        UPDATE bank_accounts
+        SET balance = (SELECT COALESCE(SUM(amount), 0) FROM donations WHERE status = 'completed')
+        WHERE name = 'Main Account'
+    """,
+    """
+        UPDATE savings_accounts a
+        SET balance = COALESCE((
+            SELECT SUM(CASE WHEN t.transaction_type = 'deposit' THEN t.amount ELSE -t.amount END)
+            FROM savings_transactions t WHERE t.account_id = a.id
+        ), 0)
+    """,
+]
+
+
+def parse_overrides(values):
+    overrides = {}
+    for value in values:
+        table, _, count = value.partition("=")
+        if table not in BASE_ROWS or not count.isdigit():
+            raise SystemExit(f"--rows expects table=N with table one of: {', '.join(BASE_ROWS)}")
+        overrides[table] = int(count)
+    return overrides
+
+
+def write_placeholder_blob():
+    digest = hashlib.sha256(PLACEHOLDER_BLOB).hexdigest()
+    relative = BLOB_DIR / digest[:2] / digest[2:4] / digest
+    path = relative if relative.is_absolute() else ROOT / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(PLACEHOLDER_BLOB)
+    return digest, str(relative)
+
+
+def table_seed(seed, table):
+    """setseed() argument for one table, independent of the other tables' counts"""
+    return random.Random(f"{seed}:{table}").uniform(-1, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="multiplier applied to every table's base row count")
+    parser.add_argument("--rows", action="append", default=[], metavar="TABLE=N",
+                        help="exact row count for one table; repeatable")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--reset", action="store_true",
+                        help="allow replacing existing data")
+    args = parser.parse_args()
+
+    counts = {table: max(1, round(rows * args.scale)) for table, rows in BASE_ROWS.items()}
+    counts.update(parse_overrides(args.rows))
+
+    subprocess.run([sys.executable, "main.py", "migrate"], cwd=ROOT, check=True)
+
+    conn = psycopg2.connect(os.environ["DATABASE_URL"])
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT EXISTS (SELECT 1 FROM donations) OR EXISTS (SELECT 1 FROM donors)")
+        if cursor.fetchone()[0] and not args.reset:
+            raise SystemExit("The database already holds data; pass --reset to replace it")
+
+        cursor.execute(f"TRUNCATE {', '.join(GENERATED_TABLES)} RESTART IDENTITY CASCADE")
+        cursor.execute("INSERT INTO folders (id, name) VALUES ('root', 'Fundraising Documents')")
+
+        blob_hash, blob_path = write_placeholder_blob()
+        cursor.execute("INSERT INTO blobs (hash, path, size) VALUES (%s, %s, %s)",
+                       (blob_hash, blob_path, len(PLACEHOLDER_BLOB)))
+
+        params = {
+            "seed": str(args.seed),
+            "first": FIRST_NAMES,
+            "last": LAST_NAMES,
+            "words": WORDS,
+            "methods": PAYMENT_METHODS,
+            "blob_hash": blob_hash,
+            "blob_path": blob_path,
+            "blob_size": len(PLACEHOLDER_BLOB),
+        }
+        started = time.perf_counter()
+        for table, trigger in COUNT_TRIGGERS:
+            cursor.execute(f"ALTER TABLE {table} DISABLE TRIGGER {trigger}")
+        for table, sql in GENERATORS:
+            t0 = time.perf_counter()
+            cursor.execute("SELECT setseed(%s)", (table_seed(args.seed, table),))
+            cursor.execute(sql, dict(params, n=counts[table]))
+            print(f"{table:>24}: {cursor.rowcount:>9} rows in {time.perf_counter() - t0:6.1f}s")
+        for sql in FINALIZE:
+            cursor.execute(sql)
+        for table, trigger in COUNT_TRIGGERS:
+            cursor.execute(f"ALTER TABLE {table} ENABLE TRIGGER {trigger}")
+        conn.commit()
+
+        conn.autocommit = True
+        cursor.execute("VACUUM ANALYZE")
+        print(f"Generated in {time.perf_counter() - started:.1f}s (seed {args.seed}, scale {args.scale})")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
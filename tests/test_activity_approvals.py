@@ -0,0 +1,64 @@
+"""GET /activity-approvals/ must not issue a query per approval."""
+from datetime import datetime
+
+import pytest
+
+import main
+
+
+class FakeCursor:
+    def __init__(self, approvals, budget_items):
+        self.approvals = approvals
+        self.budget_items = budget_items
+        self.executed = []
+
+    def execute(self, query, params=None):
+        self.executed.append(query)
+
+    def fetchall(self):
+        if "FROM activity_approvals" in self.executed[-1]:
+            return self.approvals
+        return self.budget_items
+
+
+class FakeConnection:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def cursor(self):
+        return self._cursor
+
+    def close(self):
+        pass
+
+
+def fake_data(n):
+    now = datetime(2024, 1, 1)
+    approvals = [
+        (i, i, f"Activity {i}", "staff", 100.0, None, "pending", now, None, None, None)
+        for i in range(1, n + 1)
+    ]
+    budget_items = [
+        (i * 10 + j, 1, i, f"Item {j}", None, 1, 5.0, 5.0, "supplies", now)
+        for i in range(1, n + 1)
+        for j in range(2)
+    ]
+    return approvals, budget_items
+
+
+def queries_for(monkeypatch, n):
+    cursor = FakeCursor(*fake_data(n))
+    monkeypatch.setattr(main, "get_db", lambda: FakeConnection(cursor))
+    approvals = main.get_activity_approvals()
+    assert len(approvals) == n
+    assert all(len(approval["budget_items"]) == 2 for approval in approvals)
+    return len(cursor.executed)
+
+
+@pytest.mark.parametrize("n", [5, 20])
+def test_query_count_does_not_grow_with_approvals(monkeypatch, n):
+    assert queries_for(monkeypatch, n) == queries_for(monkeypatch, n * 10) == 2
+
+
+def test_no_budget_item_query_without_approvals(monkeypatch):
+    assert queries_for(monkeypatch, 0) == 1